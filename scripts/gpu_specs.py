@@ -11,31 +11,166 @@ Features:
 - Automatic platform detection
 - Unified output format across all vendors
 - Fallback mechanisms for missing dependencies
-- Integration with PyTorch backends
+- PyTorch is only imported lazily, as a last-resort fallback
 
 Requirements:
-- NVIDIA: pynvml, torch with CUDA support
-- AMD: rocm-smi, torch with ROCm support
-- Apple: system_profiler, sysctl (built-in macOS tools)
+- NVIDIA: pynvml
+- AMD: rocm-smi
+- Apple: sysctl (built-in macOS tool), system_profiler as a fallback
+
+Results are cached in the per-user cache directory until the next reboot,
+driver update or change to this script; pass --no-cache to force a fresh
+detection.
 
 Usage:
-    python3 scripts/gpu_specs.py
+    python3 scripts/gpu_specs.py [--no-cache]
     pixi run gpu-specs
 """
 
+import argparse
+import atexit
+import dataclasses
+import functools
+import hashlib
+import json
+import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+import tempfile
+from typing import Optional, Dict, Any, List, Tuple
+
+_NVIDIA_ARCH_MAP = {
+    (5, 0): "Maxwell",
+    (5, 2): "Maxwell",
+    (5, 3): "Maxwell",
+    (6, 0): "Pascal",
+    (6, 1): "Pascal",
+    (6, 2): "Pascal",
+    (7, 0): "Volta",
+    (7, 2): "Volta",
+    (7, 5): "Turing",
+    (8, 0): "Ampere",
+    (8, 6): "Ampere",
+    (8, 7): "Ampere",
+    (8, 9): "Ada",
+    (9, 0): "Hopper",
+}
+
+# Architectural shared memory maximum per SM in KB (Ada=128KB, Ampere=164KB),
+# with a per-major fallback for unlisted minors; Maxwell and older get 64KB
+_NVIDIA_ARCH_SHMEM_KB = {
+    (6, 0): 96,
+    (6, 1): 96,
+    (6, 2): 96,
+    (7, 0): 80,
+    (7, 2): 80,
+    (7, 5): 96,
+    (8, 0): 164,
+    (8, 6): 164,
+    (8, 7): 164,
+    (8, 9): 128,
+    (9, 0): 228,
+    (10, 0): 228,
+    (11, 0): 228,
+    (12, 0): 128,
+}
+_NVIDIA_ARCH_SHMEM_KB_BY_MAJOR = {
+    12: 128,
+    11: 228,
+    10: 228,
+    9: 228,
+    8: 164,
+    7: 80,
+    6: 96,
+}
+
+# Per-SM limits by compute capability that NVML does not expose directly:
+# (CUDA cores per SM, max resident threads per SM, operational shared memory
+# per SM in KB). The last field is what the CUDA runtime reports as usable
+# shared memory per SM (cudaDevAttrMaxSharedMemoryPerMultiprocessor), printed
+# as the "operational limit". It deliberately differs from the architectural
+# maximum in _NVIDIA_ARCH_SHMEM_KB (e.g. 8.6: 100 vs 164); do not sync them.
+_NVIDIA_SM_LIMITS = {
+    (5, 0): (128, 2048, 64),
+    (5, 2): (128, 2048, 96),
+    (5, 3): (128, 2048, 64),
+    (6, 0): (64, 2048, 64),
+    (6, 1): (128, 2048, 96),
+    (6, 2): (128, 2048, 64),
+    (7, 0): (64, 2048, 96),
+    (7, 2): (64, 2048, 96),
+    (7, 5): (64, 1024, 64),
+    (8, 0): (64, 2048, 164),
+    (8, 6): (128, 1536, 100),
+    (8, 7): (128, 1536, 164),
+    (8, 9): (128, 1536, 100),
+    (9, 0): (128, 2048, 228),
+    (10, 0): (128, 2048, 228),
+    (11, 0): (128, 1536, 228),
+    (12, 0): (128, 1536, 100),
+}
+
+# 64K 32-bit registers per SM on every architecture since Maxwell
+_NVIDIA_REGISTERS_PER_SM = 65536
+
+# Apple chip (generation, tier) -> GPU cores of the maximum configuration
+_APPLE_CHIP_RE = re.compile(r"Apple M(\d+)(?:\s+(Pro|Max|Ultra))?")
+_APPLE_GPU_CORES = {
+    (1, None): 8,
+    (1, "Pro"): 16,
+    (1, "Max"): 32,
+    (1, "Ultra"): 64,
+    (2, None): 10,
+    (2, "Pro"): 19,
+    (2, "Max"): 38,
+    (2, "Ultra"): 76,
+    (3, None): 10,
+    (3, "Pro"): 18,
+    (3, "Max"): 40,
+    (3, "Ultra"): 80,
+    (4, None): 10,
+    (4, "Pro"): 20,
+    (4, "Max"): 40,
+}
+
+# NVML is initialized at most once per process; the handle of device 0 is
+# kept from detection so get_nvidia_specs does not look it up again
+_NVML_INITIALIZED = False
+_NVML_HANDLE = None
+
+# Display titles for the additional_info keys the get_*_specs functions emit,
+# computed once; any other key is title-cased when printed
+_INFO_TITLES = {
+    key: key.replace("_", " ").title()
+    for key in ("unified_memory", "metal_support", "note")
+}
+
+
+def _init_nvml():
+    """Import and initialize pynvml once, shutting it down at interpreter exit"""
+    global _NVML_INITIALIZED
+    import pynvml
+
+    if not _NVML_INITIALIZED:
+        pynvml.nvmlInit()
+        atexit.register(pynvml.nvmlShutdown)
+        _NVML_INITIALIZED = True
+    return pynvml
 
-try:
-    import torch
-except ImportError:
-    torch = None
+
+def _lazy_torch():
+    """Import PyTorch on demand; it is slow to load and only used as a fallback"""
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch
 
 
-@dataclass
+@dataclasses.dataclass(slots=True)
 class GPUSpecs:
     """Unified GPU specification data structure"""
 
@@ -54,37 +189,56 @@ class GPUSpecs:
     additional_info: Optional[Dict[str, Any]] = None
 
 
+def _has_nvidia_driver(system: str) -> bool:
+    """Cheap filesystem check for an installed NVIDIA driver"""
+    if system == "Linux":
+        # /dev/dxg is the WSL2 GPU device, which has no /dev/nvidia* nodes
+        return any(
+            os.path.exists(path)
+            for path in ("/dev/nvidia0", "/proc/driver/nvidia/version", "/dev/dxg")
+        )
+    if system == "Windows":
+        system_root = os.environ.get("SystemRoot", r"C:\Windows")
+        return os.path.exists(os.path.join(system_root, "System32", "nvml.dll"))
+    # No cheap check available, let NVML decide
+    return True
+
+
+@functools.lru_cache(maxsize=1)
 def detect_platform() -> str:
     """Detect the current platform and available GPU backends"""
+    global _NVML_HANDLE
     system = platform.system()
 
     # Check for Apple Silicon
     if system == "Darwin" and platform.processor() == "arm":
         return "apple_silicon"
 
-    # Check for NVIDIA GPU availability
-    try:
-        import pynvml
+    # Check for NVIDIA GPU availability (skip the slow driver probe when no
+    # NVIDIA driver is installed)
+    if _has_nvidia_driver(system):
+        try:
+            import pynvml
+        except ImportError:
+            pynvml = None
 
-        pynvml.nvmlInit()
-        device_count = pynvml.nvmlDeviceGetCount()
-        if device_count > 0:
-            return "nvidia"
-    except (ImportError, Exception):
-        pass
+        if pynvml is not None:
+            try:
+                _init_nvml()
+                device_count = pynvml.nvmlDeviceGetCount()
+                if device_count > 0:
+                    _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+                    return "nvidia"
+            except pynvml.NVMLError:
+                pass
 
-    # Check for AMD GPU availability
-    try:
-        # Check if ROCm is available
-        result = subprocess.run(
-            ["rocm-smi", "--showproductname"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            return "amd"
-    except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-        pass
+    # Check for AMD GPU availability: the ROCm kernel driver exposes /dev/kfd,
+    # and get_amd_specs queries rocm-smi itself, so it is not run here
+    if os.path.exists("/dev/kfd") and shutil.which("rocm-smi"):
+        return "amd"
 
-    # Check PyTorch backends if available
+    # Check PyTorch backends if available (last resort, importing torch is slow)
+    torch = _lazy_torch()
     if torch:
         if torch.backends.mps.is_available():
             return "apple_silicon"
@@ -95,65 +249,50 @@ def detect_platform() -> str:
 
 
 def get_nvidia_specs(device_index: int = 0) -> GPUSpecs:
-    """Get NVIDIA GPU specifications using pynvml and PyTorch"""
+    """Get NVIDIA GPU specifications using pynvml"""
     try:
-        import pynvml
-
-        arch_map = {
-            "5.0": "Maxwell",
-            "5.2": "Maxwell",
-            "5.3": "Maxwell",
-            "6.0": "Pascal",
-            "6.1": "Pascal",
-            "6.2": "Pascal",
-            "7.0": "Volta",
-            "7.2": "Volta",
-            "7.5": "Turing",
-            "8.0": "Ampere",
-            "8.6": "Ampere",
-            "8.7": "Ampere",
-            "8.9": "Ada",
-            "9.0": "Hopper",
-        }
+        pynvml = _init_nvml()
 
-        pynvml.nvmlInit()
-        handle = pynvml.nvmlDeviceGetHandleByIndex(device_index)
+        if device_index == 0 and _NVML_HANDLE is not None:
+            handle = _NVML_HANDLE
+        else:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(device_index)
         name = pynvml.nvmlDeviceGetName(handle)
         name_str = name if isinstance(name, str) else name.decode()
-        cap = pynvml.nvmlDeviceGetCudaComputeCapability(handle)
+        cap = tuple(pynvml.nvmlDeviceGetCudaComputeCapability(handle))
 
         # Get memory info
         mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
         total_memory_gb = mem_info.total / (1024**3)
 
         cap_str = f"{cap[0]}.{cap[1]}"
-        arch = arch_map.get(cap_str, f"Compute {cap_str}")
+        arch = _NVIDIA_ARCH_MAP.get(cap, f"Compute {cap_str}")
         max_blocks = 32 if cap[0] >= 6 else 16
 
-        # Get PyTorch device properties if available
-        pytorch_shared_mem = None
+        # Per-SM limits: NVML reports the total core count, the rest follows
+        # from the compute capability
+        operational_shared_mem = None
         sm_count = None
         registers_per_sm = None
         max_threads_per_sm = None
 
-        if torch and torch.cuda.is_available():
-            d = torch.cuda.get_device_properties(device_index)
-            pytorch_shared_mem = d.shared_memory_per_multiprocessor // 1024
-            sm_count = d.multi_processor_count
-            registers_per_sm = d.regs_per_multiprocessor
-            max_threads_per_sm = d.max_threads_per_multi_processor
-
-        # Architectural maximums (for occupancy calculations)
-        if cap[0] >= 9:  # Hopper
-            arch_shared_mem = 228
-        elif cap[0] == 8:  # Ampere/Ada
-            arch_shared_mem = 128 if cap[1] == 9 else 164  # Ada=128KB, Ampere=164KB
-        elif cap[0] == 7:  # Volta/Turing
-            arch_shared_mem = 96 if cap[1] >= 5 else 80
-        elif cap[0] == 6:  # Pascal
-            arch_shared_mem = 96
-        else:  # Maxwell and older
-            arch_shared_mem = 64
+        # Unlisted capabilities use the nearest lower listed one
+        known_caps = [known for known in _NVIDIA_SM_LIMITS if known <= cap]
+        limits = _NVIDIA_SM_LIMITS[max(known_caps)] if known_caps else None
+        if limits:
+            cores_per_sm, max_threads_per_sm, operational_shared_mem = limits
+            registers_per_sm = _NVIDIA_REGISTERS_PER_SM
+            try:
+                sm_count = pynvml.nvmlDeviceGetNumGpuCores(handle) // cores_per_sm
+            except (AttributeError, pynvml.NVMLError):
+                pass
+
+        # Architectural maximums (for occupancy calculations); newer majors
+        # fall back to the newest known generation
+        newest_major = max(_NVIDIA_ARCH_SHMEM_KB_BY_MAJOR)
+        arch_shared_mem = _NVIDIA_ARCH_SHMEM_KB.get(
+            cap, _NVIDIA_ARCH_SHMEM_KB_BY_MAJOR.get(min(cap[0], newest_major), 64)
+        )
 
         return GPUSpecs(
             vendor="NVIDIA",
@@ -167,7 +306,7 @@ def get_nvidia_specs(device_index: int = 0) -> GPUSpecs:
             max_blocks_per_unit=max_blocks,
             total_memory_gb=total_memory_gb,
             additional_info={
-                "pytorch_shared_mem_kb": pytorch_shared_mem,
+                "operational_shared_mem_kb": operational_shared_mem,
                 "unit_type": "Streaming Multiprocessor (SM)",
             },
         )
@@ -176,49 +315,123 @@ def get_nvidia_specs(device_index: int = 0) -> GPUSpecs:
         raise RuntimeError(f"Failed to get NVIDIA GPU specs: {e}")
 
 
-def get_amd_specs(device_index: int = 0) -> GPUSpecs:
-    """Get AMD GPU specifications using ROCm tools"""
+def _query_rocm_smi_json(device_index: int) -> Optional[Tuple[str, Optional[float]]]:
+    """Read product name and VRAM size from `rocm-smi --json`"""
     try:
-        # Get basic info from rocm-smi
         result = subprocess.run(
-            ["rocm-smi", "--showproductname"],
+            ["rocm-smi", "--showproductname", "--showmeminfo", "vram", "--json"],
             capture_output=True,
             text=True,
             timeout=10,
         )
         if result.returncode != 0:
-            raise RuntimeError("rocm-smi not available or failed")
-
-        device_name = result.stdout.strip().split("\n")[-1].strip()
+            return None
+        card = json.loads(result.stdout)[f"card{device_index}"]
+    except (
+        OSError,
+        subprocess.TimeoutExpired,
+        json.JSONDecodeError,
+        KeyError,
+        TypeError,
+    ):
+        # Any failure here defers to the text parser
+        return None
+    if not isinstance(card, dict):
+        return None
+
+    # Key capitalization differs between rocm-smi releases
+    fields = {key.lower(): value for key, value in card.items()}
+    device_name = fields.get("card series") or fields.get("card model")
+    if not isinstance(device_name, str) or not device_name.strip():
+        return None
+    device_name = device_name.strip()
+    total_memory_gb = None
+    try:
+        total_memory_gb = int(fields["vram total memory (b)"]) / (1024**3)
+    except (KeyError, ValueError, TypeError):
+        pass
+    return device_name, total_memory_gb
 
-        # Get memory info
-        mem_result = subprocess.run(
-            ["rocm-smi", "--showmeminfo", "vram"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        total_memory_gb = None
-        if mem_result.returncode == 0:
-            lines = mem_result.stdout.strip().split("\n")
-            for line in lines:
-                if "Total" in line and "MB" in line:
-                    try:
-                        mb_value = int(line.split()[-2])
-                        total_memory_gb = mb_value / 1024
-                        break
-                    except (ValueError, IndexError):
-                        pass
 
-        # Try to get compute units from PyTorch if available
-        compute_units = None
-        if torch and hasattr(torch, "version") and hasattr(torch.version, "hip"):
+def _query_rocm_smi_text(device_index: int) -> Tuple[str, Optional[float]]:
+    """Parse product name and VRAM size from the formatted rocm-smi report"""
+    result = subprocess.run(
+        ["rocm-smi", "--showproductname", "--showmeminfo", "vram"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    if result.returncode != 0:
+        raise RuntimeError("rocm-smi not available or failed")
+
+    device_name = "AMD GPU"
+    total_memory_gb = None
+    gpu_prefix = f"GPU[{device_index}]"
+    for line in result.stdout.strip().split("\n"):
+        line = line.strip()
+        if not line.startswith(gpu_prefix):
+            continue
+        # Label capitalization differs between rocm-smi releases
+        lowered = line.lower()
+        if "card series:" in lowered:
+            start = lowered.index("card series:") + len("card series:")
+            device_name = line[start:].strip()
+        elif "total memory (b):" in lowered:
+            try:
+                total_memory_gb = int(line.split(":")[-1]) / (1024**3)
+            except ValueError:
+                pass
+        elif "Total" in line and "MB" in line:
             try:
-                if torch.cuda.is_available():  # ROCm uses torch.cuda namespace
-                    props = torch.cuda.get_device_properties(device_index)
-                    compute_units = props.multi_processor_count
-            except Exception:
+                mb_value = int(line.split()[-2])
+                total_memory_gb = mb_value / 1024
+            except (ValueError, IndexError):
                 pass
+    return device_name, total_memory_gb
+
+
+def _read_kfd_compute_units(device_index: int) -> Optional[int]:
+    """Count compute units of a GPU from its KFD topology node properties"""
+    nodes_dir = "/sys/class/kfd/kfd/topology/nodes"
+    try:
+        nodes = sorted(os.listdir(nodes_dir), key=int)
+    except (OSError, ValueError):
+        return None
+
+    gpu_nodes = []
+    for node in nodes:
+        properties = {}
+        try:
+            with open(os.path.join(nodes_dir, node, "properties")) as f:
+                for line in f.read().split("\n"):
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0] in ("simd_count", "simd_per_cu"):
+                        properties[parts[0]] = int(parts[1])
+        except (OSError, ValueError):
+            continue
+        # CPU nodes report no SIMDs
+        if properties.get("simd_count") and properties.get("simd_per_cu"):
+            gpu_nodes.append(properties)
+
+    if device_index >= len(gpu_nodes):
+        return None
+    node = gpu_nodes[device_index]
+    return node["simd_count"] // node["simd_per_cu"]
+
+
+def get_amd_specs(device_index: int = 0) -> GPUSpecs:
+    """Get AMD GPU specifications using ROCm tools"""
+    try:
+        # Get product name and memory info from a single rocm-smi invocation,
+        # preferring its JSON output and falling back to the text report on
+        # rocm-smi versions without --json
+        info = _query_rocm_smi_json(device_index)
+        if info is None:
+            info = _query_rocm_smi_text(device_index)
+        device_name, total_memory_gb = info
+
+        # Compute units from the KFD topology exposed in sysfs
+        compute_units = _read_kfd_compute_units(device_index)
 
         # AMD architecture detection based on device name
         arch = "RDNA"
@@ -250,89 +463,52 @@ def get_amd_specs(device_index: int = 0) -> GPUSpecs:
 def get_apple_silicon_specs() -> GPUSpecs:
     """Get Apple Silicon GPU specifications"""
     try:
-        # Get system info (not currently used but available for future enhancements)
-        subprocess.run(
-            ["sysctl", "-n", "machdep.cpu.brand_string"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        # Chip name and memory size from a single sysctl call (milliseconds,
+        # unlike system_profiler)
+        chip_name = "Apple Silicon"
+        total_memory_gb = None
 
-        # Get more detailed system info
-        hw_result = subprocess.run(
-            ["system_profiler", "SPHardwareDataType"],
+        result = subprocess.run(
+            ["sysctl", "-n", "machdep.cpu.brand_string", "hw.memsize"],
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=5,
         )
+        values = result.stdout.strip().split("\n")
+        if len(values) >= 1 and values[0].strip():
+            chip_name = values[0].strip()
+        if len(values) >= 2:
+            try:
+                total_memory_gb = int(values[1]) / (1024**3)
+            except ValueError:
+                pass
 
-        chip_name = "Apple Silicon"
-        total_memory_gb = None
-
-        if hw_result.returncode == 0:
-            lines = hw_result.stdout.split("\n")
-            for line in lines:
-                line = line.strip()
-                if "Chip:" in line:
-                    chip_name = line.split("Chip:")[1].strip()
-                elif "Memory:" in line:
-                    try:
-                        mem_str = line.split("Memory:")[1].strip()
-                        if "GB" in mem_str:
-                            total_memory_gb = float(mem_str.split()[0])
-                    except (ValueError, IndexError):
-                        pass
+        # Rare fallback: ask system_profiler for the GPU chipset name
+        if chip_name == "Apple Silicon":
+            try:
+                display_result = subprocess.run(
+                    ["system_profiler", "SPDisplaysDataType"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+                for line in display_result.stdout.split("\n"):
+                    line = line.strip()
+                    if "Chipset Model:" in line:
+                        chip_name = line.split("Chipset Model:")[1].strip()
+                        break
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                pass
 
         # Determine architecture based on chip
         arch = "Apple GPU"
         gpu_cores = None
 
-        if "M1" in chip_name:
-            if "Pro" in chip_name:
-                arch = "Apple M1 Pro GPU"
-                gpu_cores = 16
-            elif "Max" in chip_name:
-                arch = "Apple M1 Max GPU"
-                gpu_cores = 32
-            elif "Ultra" in chip_name:
-                arch = "Apple M1 Ultra GPU"
-                gpu_cores = 64
-            else:
-                arch = "Apple M1 GPU"
-                gpu_cores = 8
-        elif "M2" in chip_name:
-            if "Pro" in chip_name:
-                arch = "Apple M2 Pro GPU"
-                gpu_cores = 19
-            elif "Max" in chip_name:
-                arch = "Apple M2 Max GPU"
-                gpu_cores = 38
-            elif "Ultra" in chip_name:
-                arch = "Apple M2 Ultra GPU"
-                gpu_cores = 76
-            else:
-                arch = "Apple M2 GPU"
-                gpu_cores = 10
-        elif "M3" in chip_name:
-            if "Pro" in chip_name:
-                arch = "Apple M3 Pro GPU"
-                gpu_cores = 18
-            elif "Max" in chip_name:
-                arch = "Apple M3 Max GPU"
-                gpu_cores = 40
-            else:
-                arch = "Apple M3 GPU"
-                gpu_cores = 10
-        elif "M4" in chip_name:
-            if "Pro" in chip_name:
-                arch = "Apple M4 Pro GPU"
-                gpu_cores = 20
-            elif "Max" in chip_name:
-                arch = "Apple M4 Max GPU"
-                gpu_cores = 40
-            else:
-                arch = "Apple M4 GPU"
-                gpu_cores = 10
+        match = _APPLE_CHIP_RE.search(chip_name)
+        if match:
+            generation, tier = int(match[1]), match[2]
+            arch = f"Apple M{generation}{' ' + tier if tier else ''} GPU"
+            gpu_cores = _APPLE_GPU_CORES.get((generation, tier))
 
         return GPUSpecs(
             vendor="Apple",
@@ -354,12 +530,14 @@ def get_apple_silicon_specs() -> GPUSpecs:
 
 def print_gpu_specs(specs: GPUSpecs):
     """Print GPU specifications in a unified format"""
-    print(f"Device: {specs.device_name}")
-    print(f"Vendor: {specs.vendor}")
-    print(f"Architecture: {specs.architecture}")
+    lines = [
+        f"Device: {specs.device_name}",
+        f"Vendor: {specs.vendor}",
+        f"Architecture: {specs.architecture}",
+    ]
 
     if specs.compute_capability:
-        print(f"Compute Capability: {specs.compute_capability}")
+        lines.append(f"Compute Capability: {specs.compute_capability}")
 
     if specs.compute_units:
         unit_type = (
@@ -367,75 +545,184 @@ def print_gpu_specs(specs: GPUSpecs):
             if specs.additional_info
             else "Compute Units"
         )
-        print(f"{unit_type}: {specs.compute_units}")
+        lines.append(f"{unit_type}: {specs.compute_units}")
 
     if specs.registers_per_unit:
-        print(f"Registers per Unit: {specs.registers_per_unit:,}")
+        lines.append(f"Registers per Unit: {specs.registers_per_unit:,}")
 
     if specs.shared_memory_per_unit_kb:
-        print(
+        lines.append(
             f"Shared Memory per Unit: {specs.shared_memory_per_unit_kb}KB (architectural max)"
         )
 
-    if specs.additional_info and "pytorch_shared_mem_kb" in specs.additional_info:
-        pytorch_mem = specs.additional_info["pytorch_shared_mem_kb"]
-        if pytorch_mem:
-            print(f"Shared Memory per Unit: {pytorch_mem}KB (operational limit)")
+    if specs.additional_info and "operational_shared_mem_kb" in specs.additional_info:
+        operational_mem = specs.additional_info["operational_shared_mem_kb"]
+        if operational_mem:
+            lines.append(
+                f"Shared Memory per Unit: {operational_mem}KB (operational limit)"
+            )
 
     if specs.max_threads_per_unit:
-        print(f"Max Threads per Unit: {specs.max_threads_per_unit:,}")
+        lines.append(f"Max Threads per Unit: {specs.max_threads_per_unit:,}")
 
     if specs.max_blocks_per_unit:
-        print(f"Max Blocks per Unit: {specs.max_blocks_per_unit}")
+        lines.append(f"Max Blocks per Unit: {specs.max_blocks_per_unit}")
 
     if specs.total_memory_gb:
-        print(f"Total Memory: {specs.total_memory_gb:.1f}GB")
+        lines.append(f"Total Memory: {specs.total_memory_gb:.1f}GB")
 
-    # Print additional info
+    # Additional info
     if specs.additional_info:
         for key, value in specs.additional_info.items():
-            if key not in ["pytorch_shared_mem_kb", "unit_type"]:
+            if key not in ["operational_shared_mem_kb", "unit_type"]:
+                title = _INFO_TITLES.get(key) or key.replace("_", " ").title()
                 if isinstance(value, bool):
                     if value:
-                        print(f'{key.replace("_", " ").title()}: Yes')
+                        lines.append(f"{title}: Yes")
                 else:
-                    print(f'{key.replace("_", " ").title()}: {value}')
+                    lines.append(f"{title}: {value}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _boot_time() -> Optional[float]:
+    """Return the system boot time as a Unix timestamp, if it can be determined"""
+    try:
+        if platform.system() == "Linux":
+            with open("/proc/stat") as f:
+                for line in f:
+                    if line.startswith("btime"):
+                        return float(line.split()[1])
+        elif platform.system() == "Darwin":
+            # Output looks like "{ sec = 1700000000, usec = 0 } Tue Nov 14 ..."
+            result = subprocess.run(
+                ["sysctl", "-n", "kern.boottime"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            match = re.search(r"sec = (\d+)", result.stdout)
+            if match:
+                return float(match[1])
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass
+    return None
+
+
+def _cache_dir() -> str:
+    """Per-user cache directory ($XDG_CACHE_HOME or ~/.cache)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "mojo-gpu-puzzles")
+
+
+def _cache_path() -> str:
+    """Cache file location, keyed by host, kernel, driver and this script's hash"""
+    driver_file = "/proc/driver/nvidia/version"
+    driver_mtime = os.path.getmtime(driver_file) if os.path.exists(driver_file) else 0
+    with open(__file__, "rb") as f:
+        script_digest = hashlib.sha256(f.read()).hexdigest()
+    key = f"{platform.node()}|{platform.release()}|{driver_mtime}|{script_digest}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return os.path.join(_cache_dir(), f"gpu_specs_{digest}.json")
+
+
+def _load_cached_specs() -> Optional[Tuple[str, GPUSpecs]]:
+    """Return the cached (platform_type, specs) if written since the last boot"""
+    boot_time = _boot_time()
+    try:
+        path = _cache_path()
+        if boot_time is None or os.path.getmtime(path) < boot_time:
+            return None
+        with open(path) as f:
+            data = json.load(f)
+        return data["platform"], GPUSpecs(**data["specs"])
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_specs(platform_type: str, specs: GPUSpecs):
+    """Best-effort atomic write of the detected specs to the cache file"""
+    # Without a boot time the cache could never be validated, so skip it
+    if _boot_time() is None:
+        return
+
+    tmp_path = None
+    try:
+        path = _cache_path()
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            data = {"platform": platform_type, "specs": dataclasses.asdict(specs)}
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
 
+def main(argv: Optional[List[str]] = None):
+    """Main function to detect and display GPU specifications
+
+    argv defaults to no arguments rather than sys.argv, so callers importing
+    this module are not affected by their own command-line flags.
+    """
+    parser = argparse.ArgumentParser(description="Detect and report GPU specifications")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore cached results and re-run GPU detection",
+    )
+    args = parser.parse_args([] if argv is None else argv)
 
-def main():
-    """Main function to detect and display GPU specifications"""
     try:
+        cached = None if args.no_cache else _load_cached_specs()
+        if cached:
+            platform_type, specs = cached
+            print(f'Detected Platform: {platform_type.replace("_", " ").title()}\n')
+            print_gpu_specs(specs)
+            return
+
         platform_type = detect_platform()
         print(f'Detected Platform: {platform_type.replace("_", " ").title()}\n')
 
         if platform_type == "nvidia":
             specs = get_nvidia_specs()
-            print_gpu_specs(specs)
 
         elif platform_type == "amd":
             specs = get_amd_specs()
-            print_gpu_specs(specs)
 
         elif platform_type == "apple_silicon":
             specs = get_apple_silicon_specs()
-            print_gpu_specs(specs)
 
         else:
-            print("No compatible GPU detected or unsupported platform.")
-            print(
-                "Supported platforms: NVIDIA (CUDA), AMD (ROCm), Apple Silicon (Metal)"
-            )
+            lines = [
+                "No compatible GPU detected or unsupported platform.",
+                "Supported platforms: NVIDIA (CUDA), AMD (ROCm), Apple Silicon (Metal)",
+            ]
 
             # Try to provide some fallback info
+            torch = _lazy_torch()
             if torch:
-                print("\nPyTorch available: Yes")
-                print(f"CUDA available: {torch.cuda.is_available()}")
+                lines.append("\nPyTorch available: Yes")
+                lines.append(f"CUDA available: {torch.cuda.is_available()}")
                 if hasattr(torch.backends, "mps"):
-                    print(f"MPS available: {torch.backends.mps.is_available()}")
+                    lines.append(f"MPS available: {torch.backends.mps.is_available()}")
             else:
-                print(
+                lines.append(
                     "\nPyTorch not available - install PyTorch for better GPU detection"
                 )
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
+
+        print_gpu_specs(specs)
+        _save_cached_specs(platform_type, specs)
 
     except Exception as e:
         print(f"Error detecting GPU specifications: {e}")
@@ -443,4 +730,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])